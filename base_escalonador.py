@@ -1,9 +1,13 @@
+import argparse
 import random
-import time
+import heapq
+import bisect
+import itertools
+from array import array
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from abc import ABC, abstractmethod
-import math
-from copy import deepcopy
+from operator import attrgetter, sub
 
 #Atual
 
@@ -11,6 +15,11 @@ from copy import deepcopy
 # Este código fornece a base para que vocês experimentem e implementem suas próprias ideias de escalonamento, mantendo a estrutura flexível e fácil de estender.
 
 class TarefaCAV:
+    # Atributos fixos: sem __dict__ por instância, com menos memória e acesso mais rápido
+    __slots__ = ('nome', 'duracao', 'prioridade', 'tempo_restante', 'tempo_inicio', 'tempo_final', 'tempo_chegada',
+                 'tempo_em_espera', 'tempo_de_resposta', 'tempo_inicio_execucao_atual', 'tempo_final_execucao_atual',
+                 'tempo_ref', 'deadline', 'possivelmente_catastrofico', 'execucoes')
+
     def __init__(self, nome, duracao, tempo_chegada, possivelmente_catastrofico = False, prioridade=1, deadline=None):
         self.nome = nome            # Nome da tarefa (ex. Detecção de Obstáculo)
         self.duracao = duracao      # Tempo necessário para completar a tarefa (em segundos)
@@ -23,13 +32,53 @@ class TarefaCAV:
         self.tempo_de_resposta = None # Tempo desde a chegada até a primeira execução
         self.tempo_inicio_execucao_atual = None   # Hora em que a tarefa começa a execução no tempo atual
         self.tempo_final_execucao_atual = None    # Hora em que a tarefa termina a execução no tempo atual
+        self.tempo_ref = tempo_chegada   # Referência para o tempo aguardando: chegada ou fim do último burst
         self.deadline = deadline
         self.possivelmente_catastrofico = possivelmente_catastrofico # Define se a não-realização da tarefa é possivelmente catastrófica
-        self.tempos_execucao = [] # Lista de tuplas (inicio, fim) de cada burst de execução
+        self.execucoes = array('d') # Início e fim de cada burst de execução, intercalados: [inicio0, fim0, inicio1, fim1, ...]
 
     def __str__(self):
         return f"Tarefa {self.nome} (Chegada: {self.tempo_chegada}s): {self.duracao} segundos"
 
+    @property
+    def tempos_execucao(self):
+        """
+        Pares (inicio, fim) de cada burst de execução, como tupla somente leitura.
+        Para registrar um novo burst, use registrar_execucao(inicio, fim).
+        """
+        return tuple(zip(self.execucoes[::2], self.execucoes[1::2]))
+
+    def clone(self):
+        """Cópia independente da tarefa, incluindo o estado de execução e os bursts, bem mais barata que deepcopy"""
+        copia = TarefaCAV(self.nome, self.duracao, self.tempo_chegada, self.possivelmente_catastrofico, self.prioridade, self.deadline)
+        copia.tempo_restante = self.tempo_restante
+        copia.tempo_inicio = self.tempo_inicio
+        copia.tempo_final = self.tempo_final
+        copia.tempo_em_espera = self.tempo_em_espera
+        copia.tempo_de_resposta = self.tempo_de_resposta
+        copia.tempo_inicio_execucao_atual = self.tempo_inicio_execucao_atual
+        copia.tempo_final_execucao_atual = self.tempo_final_execucao_atual
+        copia.tempo_ref = self.tempo_ref
+        copia.execucoes = array('d', self.execucoes)
+        return copia
+
+    def reset(self):
+        """Volta a tarefa ao estado inicial (sem execução), para ser reaproveitada por outro escalonador"""
+        self.tempo_restante = self.duracao
+        self.tempo_inicio = None
+        self.tempo_final = None
+        self.tempo_em_espera = 0
+        self.tempo_de_resposta = None
+        self.tempo_inicio_execucao_atual = None
+        self.tempo_final_execucao_atual = None
+        self.tempo_ref = self.tempo_chegada
+        del self.execucoes[:]
+
+    def registrar_execucao(self, inicio, fim):
+        """Registra um burst de execução no buffer contíguo, sem criar uma tupla por burst"""
+        self.execucoes.append(inicio)
+        self.execucoes.append(fim)
+
     def executar(self, quantum):
         """Executa a tarefa por um tempo de 'quantum' ou até terminar"""
         tempo_exec = min(self.tempo_restante, quantum)
@@ -44,24 +93,50 @@ class TarefaCAV:
 class EscalonadorCAV(ABC):
     def __init__(self):
         self.tarefas: list[TarefaCAV] = []
-        self.menor_tarefa = None
+        self.por_duracao = []  # Min-heap de (duracao, ordem de inserção, tarefa)
         self.sobrecarga_total = 0  # Sobrecarga total acumulada
         self.tempo_atual = 0
+        self.ordem_insercao = itertools.count()
 
     def adicionar_tarefa(self, tarefa: TarefaCAV):
-        """Adiciona uma tarefa (ação do CAV) à lista de tarefas"""
-        self.tarefas.append(tarefa)
-        if (self.menor_tarefa is None):
-            self.menor_tarefa = tarefa
-        else:
-            if (tarefa.duracao < self.menor_tarefa.duracao):
-                self.menor_tarefa = tarefa
+        """Adiciona uma tarefa (ação do CAV) à lista de tarefas, mantendo-a ordenada por tempo de chegada"""
+        bisect.insort(self.tarefas, tarefa, key=attrgetter('tempo_chegada'))
+        heapq.heappush(self.por_duracao, (tarefa.duracao, next(self.ordem_insercao), tarefa))
+
+    @property
+    def menor_tarefa(self):
+        """Tarefa de menor duração (em caso de empate, a primeira adicionada)"""
+        return self.por_duracao[0][2] if self.por_duracao else None
 
     @abstractmethod
     def escalonar(self):
         """Método que será implementado pelos alunos para o algoritmo de escalonamento"""
         pass
 
+    def chave_prontas(self, tarefa):
+        """Critério de ordenação da fila de prontas (por padrão, ordem de entrada na fila)"""
+        return 0
+
+    def inserir_pronta(self, prontas, tarefa, ordem):
+        """Insere a tarefa no heap de prontas como uma entrada [chave, ordem, tarefa]"""
+        heapq.heappush(prontas, [self.chave_prontas(tarefa), next(ordem), tarefa])
+
+    def admitir_chegadas(self, chegadas, prontas, ordem):
+        """
+        Move para o heap de prontas as tarefas que já chegaram no tempo atual.
+        Como chegadas está ordenada por tempo_chegada, basta avançar pelo início da fila.
+        """
+        while chegadas and chegadas[0].tempo_chegada <= self.tempo_atual:
+            self.inserir_pronta(prontas, chegadas.popleft(), ordem)
+
+    def reinserir_preemptada(self, chegadas, prontas, tarefa, ordem):
+        """
+        Devolve ao heap de prontas uma tarefa preemptada, em O(log n).
+        As tarefas que chegaram durante a execução entram na fila antes dela.
+        """
+        self.admitir_chegadas(chegadas, prontas, ordem)
+        self.inserir_pronta(prontas, tarefa, ordem)
+
     def registrar_sobrecarga(self, tempo):
         """Adiciona tempo de sobrecarga ao total"""
         self.sobrecarga_total += tempo
@@ -70,76 +145,89 @@ class EscalonadorCAV(ABC):
         """Exibe a sobrecarga total acumulada"""
         # print(f"Sobrecarga total acumulada: {self.sobrecarga_total} segundos.\n")
         
-    def calcular_e_exibir_metricas(self):
+    def calcular_e_exibir_metricas(self, verbose=False):
         """
         Calcula e exibe o tempo de turnaround médio e a sobrecarga total
-        para a simulação.
+        para a simulação. Só exibe (e só calcula) com verbose=True.
         """
-        tempos_de_turnaround = []
+        if not verbose:
+            return
+
         if not self.tarefas:
-            # print("Nenhuma tarefa para calcular métricas.")
+            print("Nenhuma tarefa para calcular métricas.")
             return
 
-        # print("\n--- Resultados da Simulação ---")
+        print("\n--- Resultados da Simulação ---")
         for tarefa in self.tarefas:
-            if tarefa.tempo_final != None:  # Calcula apenas para self.tarefas que foram concluídas
+            if tarefa.tempo_final is not None:  # Calcula apenas para self.tarefas que foram concluídas
                 turnaround = tarefa.tempo_final - tarefa.tempo_chegada
-                tempos_de_turnaround.append(turnaround)
-                # print(f"  - Tarefa '{tarefa.nome}':")
-                # print(f"    - Chegada: {tarefa.tempo_chegada:.2f}s, Conclusão: {tarefa.tempo_final:.2f}s")
-                # print(f"    - Tempo de Turnaround: {turnaround:.2f}s")
+                print(f"  - Tarefa '{tarefa.nome}':")
+                print(f"    - Chegada: {tarefa.tempo_chegada:.2f}s, Conclusão: {tarefa.tempo_final:.2f}s")
+                print(f"    - Tempo de Turnaround: {turnaround:.2f}s")
             else:
-                # print(f"  - Tarefa '{tarefa.nome}' não foi concluída.")
-                pass
+                print(f"  - Tarefa '{tarefa.nome}' não foi concluída.")
 
-        if tempos_de_turnaround:
-            avg_turnaround = sum(tempos_de_turnaround) / \
-                len(tempos_de_turnaround)
-            # print(f"**Turnaround Médio**: {avg_turnaround:.2f} segundos.")
+        avg_turnaround = self.calcular_turnaround_medio()
+        if avg_turnaround is not None:
+            print(f"**Turnaround Médio**: {avg_turnaround:.2f} segundos.")
         else:
-            # print("**Turnaround Médio**: N/A (Nenhuma tarefa concluída).")
-            pass
+            print("**Turnaround Médio**: N/A (Nenhuma tarefa concluída).")
 
-        # print(f"**Sobrecarga Total Acumulada**: {self.sobrecarga_total:.2f} segundos.")
-        # print("------------------------------\n")
+        print(f"**Sobrecarga Total Acumulada**: {self.sobrecarga_total:.2f} segundos.")
+        print("------------------------------\n")
         
+    def tarefas_concluidas(self):
+        """Retorna apenas as tarefas que foram concluídas (com tempo_final definido)"""
+        return [tarefa for tarefa in self.tarefas if tarefa.tempo_final is not None]
+
     def calcular_turnaround_medio(self):
-        tempos_de_turnaround = []
-        for tarefa in self.tarefas:
-            if tarefa.tempo_final != None:  # Calcula apenas para self.tarefas que foram concluídas
-                turnaround = tarefa.tempo_final - tarefa.tempo_chegada
-                tempos_de_turnaround.append(turnaround)
-        if tempos_de_turnaround:
-            return sum(tempos_de_turnaround) / len(tempos_de_turnaround)
+        concluidas = self.tarefas_concluidas()
+        if concluidas:
+            # Subtrações e soma feitas por map/sum, sem laço em Python
+            finais, chegadas = map(attrgetter('tempo_final'), concluidas), map(attrgetter('tempo_chegada'), concluidas)
+            return sum(map(sub, finais, chegadas)) / len(concluidas)
         return None
 
+    def colunas(self, *atributos):
+        """Retorna uma lista por atributo (estrutura de arrays) com os valores de self.tarefas, na ordem atual"""
+        return tuple(list(map(attrgetter(atributo), self.tarefas)) for atributo in atributos)
+
 # A classe base Escalonador define a estrutura para os escalonadores, incluindo um método escalonar
 # que vocês deverão implementar em suas versões específicas de escalonamento (como FIFO e Round Robin).
 
+def calcular_tempos_fifo(chegadas, duracoes):
+    """Núcleo numérico do FIFO: recebe chegadas (em ordem) e durações e retorna as listas de inícios e finais"""
+    inicios = []
+    finais = []
+    tempo_atual = chegadas[0] if chegadas else 0
+    for chegada, duracao in zip(chegadas, duracoes):
+        inicio = max(tempo_atual, chegada)
+        tempo_atual = inicio + duracao
+        inicios.append(inicio)
+        finais.append(tempo_atual)
+    return inicios, finais
+
 class EscalonadorFIFO(EscalonadorCAV):
     def escalonar(self):
         """Escalonamento FIFO para veículos autônomos"""
-        self.tarefas.sort(key=lambda tarefa: tarefa.tempo_chegada)
         
         if (len(self.tarefas) > 0):
-            self.tempo_atual = self.tarefas[0].tempo_chegada  # Inicializa o relógio da simulação
-            for tarefa in self.tarefas:
-                tarefa.tempo_inicio = max(self.tempo_atual, tarefa.tempo_chegada)
-                tarefa.tempo_inicio_execucao_atual = tarefa.tempo_inicio
-                
-                self.tempo_atual = tarefa.tempo_inicio
-                # print(f"[{self.tempo_atual}s] Executando tarefa {tarefa.nome} de {tarefa.duracao} segundos. (chegada: {tarefa.tempo_chegada}s)")
-                # time.sleep(tarefa.duracao / 10)  # Simula a execução da tarefa 10x mais rápido
-                self.tempo_atual += tarefa.duracao
-                
-                tarefa.tempo_final_execucao_atual = self.tempo_atual
-                tarefa.tempos_execucao.append((tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual))
-                tarefa.tempo_final = self.tempo_atual
-                tarefa.tempo_em_espera = tarefa.tempo_inicio - tarefa.tempo_chegada
+            chegadas, duracoes = self.colunas('tempo_chegada', 'duracao')
+            inicios, finais = calcular_tempos_fifo(chegadas, duracoes)
+
+            # Escreve os resultados de volta nas tarefas em uma única passada
+            for tarefa, inicio, final in zip(self.tarefas, inicios, finais):
+                # print(f"[{inicio}s] Executando tarefa {tarefa.nome} de {tarefa.duracao} segundos. (chegada: {tarefa.tempo_chegada}s)")
+                tarefa.tempo_inicio = inicio
+                tarefa.tempo_inicio_execucao_atual = inicio
+                tarefa.tempo_final_execucao_atual = final
+                tarefa.registrar_execucao(inicio, final)
+                tarefa.tempo_final = final
+                tarefa.tempo_em_espera = inicio - tarefa.tempo_chegada
                 tarefa.tempo_de_resposta = tarefa.tempo_em_espera
-                # Registrando a sobrecarga, como exemplo, podemos adicionar um tempo fixo de sobrecarga
-                #self.registrar_sobrecarga(0.5)  # 0.5 segundos de sobrecarga por tarefa (simulando troca de contexto)
-                # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} finalizada.\nBursts: {tarefa.tempos_execucao}")
+                # print(f"[{final}s] Tarefa {tarefa.nome} finalizada.\nBursts: {tarefa.tempos_execucao}")
+
+            self.tempo_atual = finais[-1]
 
         self.exibir_sobrecarga()
 
@@ -147,19 +235,24 @@ class EscalonadorFIFO(EscalonadorCAV):
 
 class EscalonadorSJF(EscalonadorCAV):
 
+    def chave_prontas(self, tarefa):
+        return tarefa.duracao
+
     def escalonar(self):
-        self.tarefas.sort(key=lambda tarefa: tarefa.tempo_chegada)
-        fila = deque(self.tarefas)
+        chegadas = deque(self.tarefas)  # Tarefas ainda não admitidas, em ordem de chegada
+        prontas = []
+        ordem = itertools.count()
 
         if (len(self.tarefas) > 0):
             self.tempo_atual = self.tarefas[0].tempo_chegada
 
-            while fila: 
-                tarefas_que_chegaram = [tarefa for tarefa in fila if tarefa.tempo_chegada <= self.tempo_atual]
-                tarefas_que_chegaram.sort(key=lambda tarefa: tarefa.duracao)
-                if len(tarefas_que_chegaram) > 0: 
-                    tarefa = tarefas_que_chegaram[0]
-                    fila.remove(tarefa)
+            while chegadas or prontas:
+                self.admitir_chegadas(chegadas, prontas, ordem)
+                if (len(prontas) == 0):
+                    # Nenhuma tarefa pronta: avança o relógio direto para a próxima chegada
+                    self.tempo_atual = chegadas[0].tempo_chegada
+                    continue
+                tarefa = heapq.heappop(prontas)[2]
 
                 tarefa.tempo_inicio = max(self.tempo_atual, tarefa.tempo_chegada)
                 tarefa.tempo_inicio_execucao_atual = tarefa.tempo_inicio
@@ -170,7 +263,7 @@ class EscalonadorSJF(EscalonadorCAV):
                 self.tempo_atual += tarefa.duracao
                 
                 tarefa.tempo_final_execucao_atual = self.tempo_atual
-                tarefa.tempos_execucao.append((tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual))
+                tarefa.registrar_execucao(tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual)
                 tarefa.tempo_final = self.tempo_atual
                 tarefa.tempo_em_espera = tarefa.tempo_inicio - tarefa.tempo_chegada
                 tarefa.tempo_de_resposta = tarefa.tempo_em_espera
@@ -185,27 +278,33 @@ class EscalonadorRoundRobin(EscalonadorCAV):
         super().__init__()
         self.quantum = quantum
 
+    def admitir_na_fila(self, chegadas, prontas):
+        """A fila do Round Robin é FIFO pura: as tarefas que já chegaram vão para o fim da deque, em O(1)"""
+        while chegadas and chegadas[0].tempo_chegada <= self.tempo_atual:
+            prontas.append(chegadas.popleft())
+
     def escalonar(self):
         """Escalonamento Round Robin com tarefas de CAVs"""
-        self.tarefas.sort(key=lambda tarefa: tarefa.tempo_chegada)
-        fila = deque(self.tarefas)
-        
+        chegadas = deque(self.tarefas)  # Tarefas ainda não admitidas, em ordem de chegada
+        prontas = deque()  # Tarefas que já chegaram, na ordem em que serão executadas
+        quantum = self.quantum  # Fixo durante toda a execução: lido uma única vez
+
         if (len(self.tarefas) > 0):
             self.tempo_atual = self.tarefas[0].tempo_chegada
-            
-            while fila:
-                tarefas_que_chegaram = [tarefa for tarefa in fila if tarefa.tempo_chegada <= self.tempo_atual]
-                if (len(tarefas_que_chegaram) == 0):
-                    self.tempo_atual = math.ceil(self.tempo_atual + 1)
+
+            while chegadas or prontas:
+                self.admitir_na_fila(chegadas, prontas)
+                if (len(prontas) == 0):
+                    # Nenhuma tarefa pronta: avança o relógio direto para a próxima chegada
+                    self.tempo_atual = chegadas[0].tempo_chegada
                     continue
-                
-                tarefa = tarefas_que_chegaram[0]
-                fila.remove(tarefa)
+
+                tarefa = prontas.popleft()
                 if tarefa.tempo_restante > 0:
                     tarefa.tempo_inicio_execucao_atual = max(self.tempo_atual, tarefa.tempo_chegada)
                     
                     tarefa.tempo_inicio = tarefa.tempo_inicio_execucao_atual if tarefa.tempo_inicio is None else tarefa.tempo_inicio
-                    tempo_exec = min(tarefa.tempo_restante, self.quantum)
+                    tempo_exec = min(tarefa.tempo_restante, quantum)
                     
                     tarefa.tempo_em_espera += tarefa.tempo_inicio_execucao_atual - (tarefa.tempo_final_execucao_atual if tarefa.tempo_final_execucao_atual is not None else 0)
                     
@@ -217,7 +316,7 @@ class EscalonadorRoundRobin(EscalonadorCAV):
                     
                     self.tempo_atual = tarefa.tempo_inicio_execucao_atual + tempo_exec
                     tarefa.tempo_final_execucao_atual = self.tempo_atual
-                    tarefa.tempos_execucao.append((tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual))
+                    tarefa.registrar_execucao(tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual)
                     tarefa.tempo_restante -= tempo_exec
                     
                     tarefa.tempo_de_resposta = tarefa.tempo_inicio - tarefa.tempo_chegada
@@ -229,15 +328,9 @@ class EscalonadorRoundRobin(EscalonadorCAV):
                         self.registrar_sobrecarga(0.3)  # 0.3 segundos de sobrecarga por tarefa
                         self.tempo_atual += 0.3
                         
-                        if (fila):
-                            for i in range(len(fila)):
-                                if (fila[i].tempo_chegada > self.tempo_atual):
-                                    fila.insert(i, tarefa)
-                                    break
-                                if (i == len(fila) - 1):
-                                    fila.append(tarefa)
-                        else:
-                            fila.append(tarefa)
+                        # Quem chegou durante o burst entra na fila antes da tarefa preemptada
+                        self.admitir_na_fila(chegadas, prontas)
+                        prontas.append(tarefa)
                         
                         # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} ainda pendente.\n")
                     else: 
@@ -255,24 +348,25 @@ class EscalonadorEDF(EscalonadorCAV):
         super().__init__()
         self.quantum = quantum
 
+    def chave_prontas(self, tarefa):
+        return tarefa.deadline
+
     def escalonar(self):
-        self.tarefas.sort(key=lambda tarefa: tarefa.tempo_chegada)
-        fila = deque(self.tarefas)
-        
+        chegadas = deque(self.tarefas)  # Tarefas ainda não admitidas, em ordem de chegada
+        prontas = []
+        ordem = itertools.count()
+
         if (len(self.tarefas) > 0):
             self.tempo_atual = self.tarefas[0].tempo_chegada
-            
-            while fila:
-                tarefas_que_chegaram = [tarefa for tarefa in fila if tarefa.tempo_chegada <= self.tempo_atual]
-                if (len(tarefas_que_chegaram) == 0):
-                    self.tempo_atual = math.ceil(self.tempo_atual + 1)
+
+            while chegadas or prontas:
+                self.admitir_chegadas(chegadas, prontas, ordem)
+                if (len(prontas) == 0):
+                    # Nenhuma tarefa pronta: avança o relógio direto para a próxima chegada
+                    self.tempo_atual = chegadas[0].tempo_chegada
                     continue
-                
-                tarefas_que_chegaram.sort(key=lambda tarefa: tarefa.deadline)
 
-                if len(tarefas_que_chegaram) > 0: 
-                    tarefa = tarefas_que_chegaram[0]
-                    fila.remove(tarefa)
+                tarefa = heapq.heappop(prontas)[2]
 
                 if tarefa.tempo_restante > 0:
                     tarefa.tempo_inicio_execucao_atual = max(self.tempo_atual, tarefa.tempo_chegada)
@@ -290,7 +384,7 @@ class EscalonadorEDF(EscalonadorCAV):
                     
                     self.tempo_atual = tarefa.tempo_inicio_execucao_atual + tempo_exec
                     tarefa.tempo_final_execucao_atual = self.tempo_atual
-                    tarefa.tempos_execucao.append((tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual))
+                    tarefa.registrar_execucao(tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual)
                     tarefa.tempo_restante -= tempo_exec
                     
                     tarefa.tempo_de_resposta = tarefa.tempo_inicio - tarefa.tempo_chegada
@@ -302,15 +396,7 @@ class EscalonadorEDF(EscalonadorCAV):
                         self.registrar_sobrecarga(0.3)  # 0.3 segundos de sobrecarga por tarefa
                         self.tempo_atual += 0.3
                         
-                        if (fila):
-                            for i in range(len(fila)):
-                                if (fila[i].tempo_chegada > self.tempo_atual):
-                                    fila.insert(i, tarefa)
-                                    break
-                                if (i == len(fila) - 1):
-                                    fila.append(tarefa)
-                        else:
-                            fila.append(tarefa)
+                        self.reinserir_preemptada(chegadas, prontas, tarefa, ordem)
                         
                         # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} ainda pendente.\n")
                     else: 
@@ -320,24 +406,26 @@ class EscalonadorEDF(EscalonadorCAV):
         self.exibir_sobrecarga()
 
 class EscalonadorPrioridadeNP(EscalonadorCAV):
+    def chave_prontas(self, tarefa):
+        return -tarefa.prioridade
+
     def escalonar(self):
         """Escalonamento por Prioridade (menor número = maior prioridade)"""
         # print("Escalonamento por Prioridade:")
-        # Ordena as tarefas pela prioridade
-        self.tarefas.sort(key=lambda tarefa: tarefa.tempo_chegada)
-        fila = deque(self.tarefas)
+        chegadas = deque(self.tarefas)  # Tarefas ainda não admitidas, em ordem de chegada
+        prontas = []
+        ordem = itertools.count()
 
         if (len(self.tarefas) > 0):
             self.tempo_atual = self.tarefas[0].tempo_chegada
-            while (fila):
-                tarefas_que_chegaram = [tarefa for tarefa in fila if tarefa.tempo_chegada <= self.tempo_atual]
-                if (len(tarefas_que_chegaram) == 0):
-                    self.tempo_atual += 1
+            while (chegadas or prontas):
+                self.admitir_chegadas(chegadas, prontas, ordem)
+                if (len(prontas) == 0):
+                    # Nenhuma tarefa pronta: avança o relógio direto para a próxima chegada
+                    self.tempo_atual = chegadas[0].tempo_chegada
                     continue
-                tarefas_que_chegaram.sort(key=lambda tarefa: tarefa.prioridade, reverse=True)
-                
-                tarefa = tarefas_que_chegaram[0]
-                fila.remove(tarefa)
+
+                tarefa = heapq.heappop(prontas)[2]
                 
                 # Executando a tarefa
                 tarefa.tempo_inicio = self.tempo_atual
@@ -351,7 +439,7 @@ class EscalonadorPrioridadeNP(EscalonadorCAV):
                 tarefa.tempo_de_resposta = tarefa.tempo_inicio - tarefa.tempo_chegada
                 tarefa.tempo_em_espera = tarefa.tempo_de_resposta
                 tarefa.tempo_final_execucao_atual = self.tempo_atual
-                tarefa.tempos_execucao.append((tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual))
+                tarefa.registrar_execucao(tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual)
 
                 # Registrando a sobrecarga, como exemplo, podemos adicionar um tempo fixo de sobrecarga
                 # self.registrar_sobrecarga(0.4)  # 0.4 segundos de sobrecarga por tarefa
@@ -364,25 +452,26 @@ class EscalonadorPrioridadeP(EscalonadorCAV):
         super().__init__()
         self.quantum = quantum
 
+    def chave_prontas(self, tarefa):
+        return -tarefa.prioridade
+
     def escalonar(self):
         """Escalonamento por prioridade preemptivo com tarefas de CAVs"""
-        self.tarefas.sort(key=lambda tarefa: tarefa.tempo_chegada)
-        fila = deque(self.tarefas)
-        
+        chegadas = deque(self.tarefas)  # Tarefas ainda não admitidas, em ordem de chegada
+        prontas = []
+        ordem = itertools.count(0, -1)  # Em caso de empate, a última tarefa a entrar na fila é escolhida
+
         if (len(self.tarefas) > 0):
             self.tempo_atual = self.tarefas[0].tempo_chegada
-            
-            while fila:
-                tarefas_que_chegaram = [tarefa for tarefa in fila if tarefa.tempo_chegada <= self.tempo_atual]
-                if (len(tarefas_que_chegaram) == 0):
-                    self.tempo_atual = math.ceil(self.tempo_atual + 1)
+
+            while chegadas or prontas:
+                self.admitir_chegadas(chegadas, prontas, ordem)
+                if (len(prontas) == 0):
+                    # Nenhuma tarefa pronta: avança o relógio direto para a próxima chegada
+                    self.tempo_atual = chegadas[0].tempo_chegada
                     continue
-                
-                tarefas_que_chegaram.sort(key=lambda tarefas: tarefas.prioridade)
 
-                if len(tarefas_que_chegaram) > 0: 
-                    tarefa = tarefas_que_chegaram[len(tarefas_que_chegaram)-1]
-                    fila.remove(tarefa)
+                tarefa = heapq.heappop(prontas)[2]
 
                 if tarefa.tempo_restante > 0:
                     tarefa.tempo_inicio_execucao_atual = max(self.tempo_atual, tarefa.tempo_chegada)
@@ -400,7 +489,7 @@ class EscalonadorPrioridadeP(EscalonadorCAV):
                     
                     self.tempo_atual = tarefa.tempo_inicio_execucao_atual + tempo_exec
                     tarefa.tempo_final_execucao_atual = self.tempo_atual
-                    tarefa.tempos_execucao.append((tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual))
+                    tarefa.registrar_execucao(tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual)
                     tarefa.tempo_restante -= tempo_exec
                     
                     tarefa.tempo_de_resposta = tarefa.tempo_inicio - tarefa.tempo_chegada
@@ -412,15 +501,7 @@ class EscalonadorPrioridadeP(EscalonadorCAV):
                         self.registrar_sobrecarga(0.3)  # 0.3 segundos de sobrecarga por tarefa
                         self.tempo_atual += 0.3
                         
-                        if (fila):
-                            for i in range(len(fila)):
-                                if (fila[i].tempo_chegada > self.tempo_atual):
-                                    fila.insert(i, tarefa)
-                                    break
-                                if (i == len(fila) - 1):
-                                    fila.append(tarefa)
-                        else:
-                            fila.append(tarefa)
+                        self.reinserir_preemptada(chegadas, prontas, tarefa, ordem)
                         
                         # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} ainda pendente.\n")
                     else: 
@@ -438,24 +519,27 @@ class EscalonadorUG(EscalonadorCAV):
     def urgencia(self, prioridade, deadline, tempo_resta, urg_max):
         if deadline > tempo_resta: return prioridade/(deadline-tempo_resta)
         return urg_max + 1
+
+    def chave_prontas(self, tarefa):
+        return -tarefa.prioridade
     
     #urg_max é urgencia máxima, que vai servir de parâmetro de comparação para decidir se o quantum aumenta ou não
     def escalonar(self, urg_max=1/2):
-        self.tarefas.sort(key=lambda tarefa: tarefa.tempo_chegada)
-        fila = deque(self.tarefas)
-    
+        chegadas = deque(self.tarefas)  # Tarefas ainda não admitidas, em ordem de chegada
+        prontas = []
+        ordem = itertools.count(0, -1)  # Em caso de empate, a última tarefa a entrar na fila é escolhida
+
         if (len(self.tarefas) > 0):
             self.tempo_atual = self.tarefas[0].tempo_chegada
-            
-            while fila:
-                tarefas_que_chegaram = [tarefa for tarefa in fila if tarefa.tempo_chegada <= self.tempo_atual]
-                if (len(tarefas_que_chegaram) == 0):
-                    self.tempo_atual = math.ceil(self.tempo_atual + 1)
+
+            while chegadas or prontas:
+                self.admitir_chegadas(chegadas, prontas, ordem)
+                if (len(prontas) == 0):
+                    # Nenhuma tarefa pronta: avança o relógio direto para a próxima chegada
+                    self.tempo_atual = chegadas[0].tempo_chegada
                     continue
-                
-                tarefas_que_chegaram.sort(key=lambda tarefa: tarefa.prioridade)
-                tarefa = tarefas_que_chegaram[len(tarefas_que_chegaram)-1]
-                fila.remove(tarefa)
+
+                tarefa = heapq.heappop(prontas)[2]
 
                 if tarefa.tempo_restante > 0:
                     tarefa.tempo_inicio_execucao_atual = max(self.tempo_atual, tarefa.tempo_chegada)
@@ -478,7 +562,7 @@ class EscalonadorUG(EscalonadorCAV):
                     
                     self.tempo_atual = tarefa.tempo_inicio_execucao_atual + tempo_exec
                     tarefa.tempo_final_execucao_atual = self.tempo_atual
-                    tarefa.tempos_execucao.append((tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual))
+                    tarefa.registrar_execucao(tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual)
                     tarefa.tempo_restante -= tempo_exec
                     
                     tarefa.tempo_de_resposta = tarefa.tempo_inicio - tarefa.tempo_chegada
@@ -490,15 +574,7 @@ class EscalonadorUG(EscalonadorCAV):
                         self.registrar_sobrecarga(0.3)  # 0.3 segundos de sobrecarga por tarefa
                         self.tempo_atual += 0.3
                         
-                        if (fila):
-                            for i in range(len(fila)):
-                                if (fila[i].tempo_chegada > self.tempo_atual):
-                                    fila.insert(i, tarefa)
-                                    break
-                                if (i == len(fila) - 1):
-                                    fila.append(tarefa)
-                        else:
-                            fila.append(tarefa)
+                        self.reinserir_preemptada(chegadas, prontas, tarefa, ordem)
                         
                         # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} ainda pendente.\n")
                     else: 
@@ -508,395 +584,130 @@ class EscalonadorUG(EscalonadorCAV):
 
         self.exibir_sobrecarga()
 
-# class EscalonadorFutureVision(EscalonadorCAV):
-#     def __init__(self, quantum):
-#         super().__init__()
-#         self.quantum = quantum
-
-#     def limite(self, tarefas_que_chegaram):
-#         if (len(tarefas_que_chegaram) > 0):
-#             duracao_total = 0
-#             mediana_chegada = 0
-
-#             if (len(tarefas_que_chegaram) % 2 == 0):
-#                 mediana_chegada = (tarefas_que_chegaram[len(tarefas_que_chegaram) // 2 - 1].tempo_chegada + tarefas_que_chegaram[len(tarefas_que_chegaram) // 2].tempo_chegada) / 2
-#             else:
-#                 mediana_chegada = tarefas_que_chegaram[len(tarefas_que_chegaram) // 2].tempo_chegada
-
-            
-
-#             for tarefa in tarefas_que_chegaram: 
-#                 duracao_total += tarefa.tempo_restante
-
-#             duracao_media = duracao_total/len(tarefas_que_chegaram)
-#             lim_espera = duracao_media + mediana_chegada
-#             return lim_espera
-#         return 0
-
-#     def escalonar(self):
-#         """Escalonamento Round Robin com tarefas de CAVs"""
-#         self.tarefas.sort(key=lambda tarefa: tarefa.tempo_chegada)
-#         fila = deque(self.tarefas)
-        
-#         if (len(self.tarefas) > 0):
-#             self.tempo_atual = self.tarefas[0].tempo_chegada
-            
-#             while fila:
-#                 tarefas_que_chegaram = [tarefa for tarefa in fila if tarefa.tempo_chegada <= self.tempo_atual]
-#                 if (len(tarefas_que_chegaram) == 0):
-#                     self.tempo_atual = math.ceil(self.tempo_atual + 1)
-#                     continue
-                
-#                 tarefas_que_chegaram.sort(key=lambda tarefa: tarefa.tempo_restante)
-#                 tarefa = tarefas_que_chegaram[0]
-#                 tarefa_maior_que_limite = None
-                
-                
-                
-#                 for t in tarefas_que_chegaram:
-#                     tempo_aguardando = self.tempo_atual - t.tempo_final_execucao_atual if (
-#                         t.tempo_final_execucao_atual is not None) else self.tempo_atual - t.tempo_chegada
-#                     if tempo_aguardando > self.limite(tarefas_que_chegaram):
-#                         tarefa_maior_que_limite = t
-#                         break
-#                 if tarefa_maior_que_limite is not None:
-#                     tarefa = tarefa_maior_que_limite
-                    
-#                 fila.remove(tarefa)
+class EscalonadorFutureVision(EscalonadorCAV):
+    """
+    Executa primeiro a tarefa com menor tempo restante, a não ser que alguma tarefa pronta
+    esteja aguardando há mais que o limite de espera; o modo define como o limite é calculado.
+    """
+    # Chegada de referência somada à duração média no limite de espera, conforme o modo
+    MODOS = ('mediana', 'media', 'intervalo', 'min', 'max')
 
-#                 if tarefa.tempo_restante > 0:
-#                     tempo_aguardando = self.tempo_atual - tarefa.tempo_final_execucao_atual if (
-#                         tarefa.tempo_final_execucao_atual is not None) else (tarefa.tempo_de_resposta if tarefa.tempo_de_resposta is not None else self.tempo_atual - tarefa.tempo_chegada)
-#                     tarefa.tempo_inicio_execucao_atual = max(self.tempo_atual, tarefa.tempo_chegada)
-                    
-#                     tarefa.tempo_inicio = tarefa.tempo_inicio_execucao_atual if tarefa.tempo_inicio is None else tarefa.tempo_inicio
-#                     tempo_exec = min(tarefa.tempo_restante, self.quantum)
-                    
-#                     tarefa.tempo_em_espera += tarefa.tempo_inicio_execucao_atual - (tarefa.tempo_final_execucao_atual if tarefa.tempo_final_execucao_atual is not None else 0)
-                    
-#                     # print(f"[{self.tempo_atual}s] Executando tarefa {tarefa.nome} de {tarefa.duracao} segundos por {tempo_exec} segundos. (chegada: {tarefa.tempo_chegada}s, limite de espera: {self.limite(tarefas_que_chegaram)}s, tempo_espera: { (tempo_aguardando)}s)")
-                    
-#                     # time.sleep(tempo_exec / 10)  # Simula a execução da tarefa 10x mais rapida
-                    
-                    
-                    
-#                     self.tempo_atual = tarefa.tempo_inicio_execucao_atual + tempo_exec
-#                     tarefa.tempo_final_execucao_atual = self.tempo_atual
-#                     tarefa.tempos_execucao.append((tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual))
-#                     tarefa.tempo_restante -= tempo_exec
-                    
-#                     tarefa.tempo_de_resposta = tarefa.tempo_inicio - tarefa.tempo_chegada
-                    
-                    
-                    
-#                     if tarefa.tempo_restante > 0:
-#                         # Registrando a sobrecarga, como exemplo, podemos adicionar um tempo fixo de sobrecarga
-#                         self.registrar_sobrecarga(0.3)  # 0.3 segundos de sobrecarga por tarefa
-#                         self.tempo_atual += 0.3
-                        
-#                         if (fila):
-#                             for i in range(len(fila)):
-#                                 if (fila[i].tempo_chegada > self.tempo_atual):
-#                                     fila.insert(i, tarefa)
-#                                     break
-#                                 if (i == len(fila) - 1):
-#                                     fila.append(tarefa)
-#                         else:
-#                             fila.append(tarefa)
-                        
-#                         # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} ainda pendente.\n")
-#                     else: 
-#                         tarefa.tempo_final = self.tempo_atual
-#                         # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} finalizada.\nBursts: {tarefa.tempos_execucao}\n")
-
-#         self.exibir_sobrecarga()
-
-
-# class EscalonadorFutureVisionMedia(EscalonadorCAV):
-#     def __init__(self, quantum):
-#         super().__init__()
-#         self.quantum = quantum
-
-#     def limite(self, tarefas_que_chegaram):
-#         if (len(tarefas_que_chegaram) > 0):
-#             duracao_total = 0
-#             chegada_total = 0
-
-#             for tarefa in tarefas_que_chegaram:
-#                 duracao_total += tarefa.tempo_restante
-#                 chegada_total += tarefa.tempo_chegada
-
-#             duracao_media = duracao_total/len(tarefas_que_chegaram)
-#             chegada_media = chegada_total/len(tarefas_que_chegaram)
-#             lim_espera = duracao_media + chegada_media
-#             return lim_espera
-#         return 0
-
-#     def escalonar(self):
-#         """Escalonamento Round Robin com tarefas de CAVs"""
-#         self.tarefas.sort(key=lambda tarefa: tarefa.tempo_chegada)
-#         fila = deque(self.tarefas)
-
-#         if (len(self.tarefas) > 0):
-#             self.tempo_atual = self.tarefas[0].tempo_chegada
-
-#             while fila:
-#                 tarefas_que_chegaram = [
-#                     tarefa for tarefa in fila if tarefa.tempo_chegada <= self.tempo_atual]
-#                 if (len(tarefas_que_chegaram) == 0):
-#                     self.tempo_atual = math.ceil(self.tempo_atual + 1)
-#                     continue
-
-#                 tarefas_que_chegaram.sort(
-#                     key=lambda tarefa: tarefa.tempo_restante)
-#                 tarefa = tarefas_que_chegaram[0]
-#                 tarefa_maior_que_limite = None
-
-#                 for t in tarefas_que_chegaram:
-#                     tempo_aguardando = self.tempo_atual - t.tempo_final_execucao_atual if (
-#                         t.tempo_final_execucao_atual is not None) else self.tempo_atual - t.tempo_chegada
-#                     if tempo_aguardando > self.limite(tarefas_que_chegaram):
-#                         tarefa_maior_que_limite = t
-#                         break
-#                 if tarefa_maior_que_limite is not None:
-#                     tarefa = tarefa_maior_que_limite
-
-#                 fila.remove(tarefa)
-
-#                 if tarefa.tempo_restante > 0:
-#                     tempo_aguardando = self.tempo_atual - tarefa.tempo_final_execucao_atual if (
-#                         tarefa.tempo_final_execucao_atual is not None) else (tarefa.tempo_de_resposta if tarefa.tempo_de_resposta is not None else self.tempo_atual - tarefa.tempo_chegada)
-#                     tarefa.tempo_inicio_execucao_atual = max(
-#                         self.tempo_atual, tarefa.tempo_chegada)
-
-#                     tarefa.tempo_inicio = tarefa.tempo_inicio_execucao_atual if tarefa.tempo_inicio is None else tarefa.tempo_inicio
-#                     tempo_exec = min(tarefa.tempo_restante, self.quantum)
-
-#                     tarefa.tempo_em_espera += tarefa.tempo_inicio_execucao_atual - \
-#                         (tarefa.tempo_final_execucao_atual if tarefa.tempo_final_execucao_atual is not None else 0)
-
-#                     # print(f"[{self.tempo_atual}s] Executando tarefa {tarefa.nome} de {tarefa.duracao} segundos por {tempo_exec} segundos. (chegada: {tarefa.tempo_chegada}s, limite de espera: {self.limite(tarefas_que_chegaram)}s, tempo_espera: {(tempo_aguardando)}s)")
-
-#                     # time.sleep(tempo_exec / 10)  # Simula a execução da tarefa 10x mais rapida
-
-#                     self.tempo_atual = tarefa.tempo_inicio_execucao_atual + tempo_exec
-#                     tarefa.tempo_final_execucao_atual = self.tempo_atual
-#                     tarefa.tempos_execucao.append(
-#                         (tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual))
-#                     tarefa.tempo_restante -= tempo_exec
-
-#                     tarefa.tempo_de_resposta = tarefa.tempo_inicio - tarefa.tempo_chegada
-
-#                     if tarefa.tempo_restante > 0:
-#                         # Registrando a sobrecarga, como exemplo, podemos adicionar um tempo fixo de sobrecarga
-#                         # 0.3 segundos de sobrecarga por tarefa
-#                         self.registrar_sobrecarga(0.3)
-#                         self.tempo_atual += 0.3
-
-#                         if (fila):
-#                             for i in range(len(fila)):
-#                                 if (fila[i].tempo_chegada > self.tempo_atual):
-#                                     fila.insert(i, tarefa)
-#                                     break
-#                                 if (i == len(fila) - 1):
-#                                     fila.append(tarefa)
-#                         else:
-#                             fila.append(tarefa)
-
-#                         # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} ainda pendente.\n")
-#                     else:
-#                         tarefa.tempo_final = self.tempo_atual
-#                         # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} finalizada.\nBursts: {tarefa.tempos_execucao}\n")
-
-#         self.exibir_sobrecarga()
-
-
-class EscalonadorFutureVisionMediaIntervalo(EscalonadorCAV):
-    def __init__(self, quantum):
+    def __init__(self, quantum, modo):
         super().__init__()
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo inválido: {modo!r} (esperado um de {self.MODOS})")
         self.quantum = quantum
+        self.modo = modo
+        self.soma_restante = 0  # Soma de tempo_restante das tarefas prontas
+        self.soma_chegada = 0  # Soma de tempo_chegada das tarefas prontas
+        self.chegadas_prontas = []  # tempo_chegada das tarefas prontas, em ordem crescente
+
+    def limite(self):
+        """Limite de espera calculado a partir das estatísticas das tarefas prontas"""
+        n = len(self.chegadas_prontas)
+        if (n > 0):
+            # Estatísticas mantidas a cada entrada/saída de prontas: O(1) por chamada
+            # A mediana é tirada das chegadas em ordem crescente (prontas está ordenada por tempo_restante)
+            if (n % 2 == 0):
+                mediana_chegada = (self.chegadas_prontas[n // 2 - 1] + self.chegadas_prontas[n // 2]) / 2
+            else:
+                mediana_chegada = self.chegadas_prontas[n // 2]
+
+            duracao_media = self.soma_restante/n
+            chegada_media_intervalo = (self.chegadas_prontas[0] + self.chegadas_prontas[-1]) // 2
+            chegada_media = self.soma_chegada/n
+
+            if self.modo == 'mediana':
+                chegada_referencia = mediana_chegada
+            elif self.modo == 'media':
+                chegada_referencia = chegada_media
+            elif self.modo == 'intervalo':
+                chegada_referencia = chegada_media_intervalo
+            elif self.modo == 'min':
+                chegada_referencia = min(chegada_media, chegada_media_intervalo, mediana_chegada)
+            else:
+                chegada_referencia = max(chegada_media, chegada_media_intervalo, mediana_chegada)
 
-    def limite(self, tarefas_que_chegaram):
-        if (len(tarefas_que_chegaram) > 0):
-            duracao_total = 0
-            min_chegada = tarefas_que_chegaram[0].tempo_chegada
-            max_chegada = tarefas_que_chegaram[0].tempo_chegada
-
-            for tarefa in tarefas_que_chegaram:
-                duracao_total += tarefa.tempo_restante
-                min_chegada = min(min_chegada, tarefa.tempo_chegada)
-                max_chegada = max(max_chegada, tarefa.tempo_chegada)
-
-            duracao_media = duracao_total/len(tarefas_que_chegaram)
-            chegada_media = (min_chegada + max_chegada) // 2
-            lim_espera = duracao_media + chegada_media
+            lim_espera = duracao_media + chegada_referencia
             return lim_espera
         return 0
 
-    def escalonar(self):
-        """Escalonamento Round Robin com tarefas de CAVs"""
-        self.tarefas.sort(key=lambda tarefa: tarefa.tempo_chegada)
-        fila = deque(self.tarefas)
+    def chave_prontas(self, tarefa):
+        return tarefa.tempo_restante
 
-        if (len(self.tarefas) > 0):
-            self.tempo_atual = self.tarefas[0].tempo_chegada
-
-            while fila:
-                tarefas_que_chegaram = [
-                    tarefa for tarefa in fila if tarefa.tempo_chegada <= self.tempo_atual]
-                if (len(tarefas_que_chegaram) == 0):
-                    self.tempo_atual = math.ceil(self.tempo_atual + 1)
-                    continue
-
-                tarefas_que_chegaram.sort(
-                    key=lambda tarefa: tarefa.tempo_restante)
-                tarefa = tarefas_que_chegaram[0]
-                tarefa_maior_que_limite = None
-
-                for t in tarefas_que_chegaram:
-                    tempo_aguardando = self.tempo_atual - t.tempo_final_execucao_atual if (
-                        t.tempo_final_execucao_atual is not None) else self.tempo_atual - t.tempo_chegada
-                    if tempo_aguardando > self.limite(tarefas_que_chegaram):
-                        tarefa_maior_que_limite = t
-                        break
-                if tarefa_maior_que_limite is not None:
-                    tarefa = tarefa_maior_que_limite
-
-                fila.remove(tarefa)
-
-                if tarefa.tempo_restante > 0:
-                    tempo_aguardando = self.tempo_atual - tarefa.tempo_final_execucao_atual if (
-                        tarefa.tempo_final_execucao_atual is not None) else (tarefa.tempo_de_resposta if tarefa.tempo_de_resposta is not None else self.tempo_atual - tarefa.tempo_chegada)
-                    tarefa.tempo_inicio_execucao_atual = max(
-                        self.tempo_atual, tarefa.tempo_chegada)
-
-                    tarefa.tempo_inicio = tarefa.tempo_inicio_execucao_atual if tarefa.tempo_inicio is None else tarefa.tempo_inicio
-                    tempo_exec = min(tarefa.tempo_restante, self.quantum)
-
-                    tarefa.tempo_em_espera += tarefa.tempo_inicio_execucao_atual - \
-                        (tarefa.tempo_final_execucao_atual if tarefa.tempo_final_execucao_atual is not None else 0)
-
-                    # print( f"[{self.tempo_atual}s] Executando tarefa {tarefa.nome} de {tarefa.duracao} segundos por {tempo_exec} segundos. (chegada: {tarefa.tempo_chegada}s, limite de espera: {self.limite(tarefas_que_chegaram)}s, tempo_espera: {(tempo_aguardando)}s)")
+    def inserir_pronta(self, prontas, tarefa, ordem):
+        """Mantém prontas como lista ordenada por (tempo_restante, ordem), inserindo com bisect em vez de reordenar a cada decisão"""
+        bisect.insort(prontas, [self.chave_prontas(tarefa), next(ordem), tarefa])
+        self.soma_restante += tarefa.tempo_restante
+        self.soma_chegada += tarefa.tempo_chegada
+        bisect.insort(self.chegadas_prontas, tarefa.tempo_chegada)
 
-                    # time.sleep(tempo_exec / 10)  # Simula a execução da tarefa 10x mais rapida
-
-                    self.tempo_atual = tarefa.tempo_inicio_execucao_atual + tempo_exec
-                    tarefa.tempo_final_execucao_atual = self.tempo_atual
-                    tarefa.tempos_execucao.append(
-                        (tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual))
-                    tarefa.tempo_restante -= tempo_exec
-
-                    tarefa.tempo_de_resposta = tarefa.tempo_inicio - tarefa.tempo_chegada
-
-                    if tarefa.tempo_restante > 0:
-                        # Registrando a sobrecarga, como exemplo, podemos adicionar um tempo fixo de sobrecarga
-                        # 0.3 segundos de sobrecarga por tarefa
-                        self.registrar_sobrecarga(0.3)
-                        self.tempo_atual += 0.3
-
-                        if (fila):
-                            for i in range(len(fila)):
-                                if (fila[i].tempo_chegada > self.tempo_atual):
-                                    fila.insert(i, tarefa)
-                                    break
-                                if (i == len(fila) - 1):
-                                    fila.append(tarefa)
-                        else:
-                            fila.append(tarefa)
-
-                        # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} ainda pendente.\n")
-                    else:
-                        tarefa.tempo_final = self.tempo_atual
-                        # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} finalizada.\nBursts: {tarefa.tempos_execucao}\n")
-
-        self.exibir_sobrecarga()
-
-
-class EscalonadorFutureVisionMin(EscalonadorCAV):
-    def __init__(self, quantum):
-        super().__init__()
-        self.quantum = quantum
-
-    def limite(self, tarefas_que_chegaram):
-        if (len(tarefas_que_chegaram) > 0):
-            duracao_total = 0
-            chegada_total = 0
-            min_chegada = tarefas_que_chegaram[0].tempo_chegada
-            max_chegada = tarefas_que_chegaram[0].tempo_chegada
-            mediana_chegada = 0
-
-            if (len(tarefas_que_chegaram) % 2 == 0):
-                mediana_chegada = (tarefas_que_chegaram[len(
-                    tarefas_que_chegaram) // 2 - 1].tempo_chegada + tarefas_que_chegaram[len(tarefas_que_chegaram) // 2].tempo_chegada) / 2
-            else:
-                mediana_chegada = tarefas_que_chegaram[len(
-                    tarefas_que_chegaram) // 2].tempo_chegada
-
-            for tarefa in tarefas_que_chegaram:
-                duracao_total += tarefa.tempo_restante
-                chegada_total += tarefa.tempo_chegada
-                min_chegada = min(min_chegada, tarefa.tempo_chegada)
-                max_chegada = max(max_chegada, tarefa.tempo_chegada)
-
-            duracao_media = duracao_total/len(tarefas_que_chegaram)
-            chegada_media_intervalo = (min_chegada + max_chegada) // 2
-            chegada_media = chegada_total/len(tarefas_que_chegaram)
-            
-            lim_espera = duracao_media + min(chegada_media, chegada_media_intervalo, mediana_chegada)
-            return lim_espera
-        return 0
+    def remover_pronta(self, prontas, indice):
+        """Remove e retorna a tarefa na posição indice de prontas, descontando-a das estatísticas do limite"""
+        tarefa = prontas.pop(indice)[2]
+        self.soma_restante -= tarefa.tempo_restante
+        self.soma_chegada -= tarefa.tempo_chegada
+        del self.chegadas_prontas[bisect.bisect_left(self.chegadas_prontas, tarefa.tempo_chegada)]
+        return tarefa
 
     def escalonar(self):
         """Escalonamento Round Robin com tarefas de CAVs"""
-        self.tarefas.sort(key=lambda tarefa: tarefa.tempo_chegada)
-        fila = deque(self.tarefas)
+        chegadas = deque(self.tarefas)  # Tarefas ainda não admitidas, em ordem de chegada
+        prontas = []
+        ordem = itertools.count()
+        self.soma_restante = 0
+        self.soma_chegada = 0
+        self.chegadas_prontas = []
+        # Métodos e atributos usados a cada decisão, lidos uma vez como variáveis locais
+        quantum = self.quantum
+        limite = self.limite
+        admitir_chegadas = self.admitir_chegadas
+        remover_pronta = self.remover_pronta
 
         if (len(self.tarefas) > 0):
             self.tempo_atual = self.tarefas[0].tempo_chegada
 
-            while fila:
-                tarefas_que_chegaram = [
-                    tarefa for tarefa in fila if tarefa.tempo_chegada <= self.tempo_atual]
-                if (len(tarefas_que_chegaram) == 0):
-                    self.tempo_atual = math.ceil(self.tempo_atual + 1)
+            while chegadas or prontas:
+                admitir_chegadas(chegadas, prontas, ordem)
+                if (len(prontas) == 0):
+                    # Nenhuma tarefa pronta: avança o relógio direto para a próxima chegada
+                    self.tempo_atual = chegadas[0].tempo_chegada
                     continue
 
-                tarefas_que_chegaram.sort(
-                    key=lambda tarefa: tarefa.tempo_restante)
-                tarefa = tarefas_que_chegaram[0]
-                tarefa_maior_que_limite = None
+                # Prontas já estão em ordem de tempo_restante (empate: ordem de entrada na fila)
+                indice_escolhido = 0
+                lim = limite()  # Não depende da tarefa analisada: calculado uma vez por decisão
+                tempo_atual = self.tempo_atual
 
-                for t in tarefas_que_chegaram:
-                    tempo_aguardando = self.tempo_atual - t.tempo_final_execucao_atual if (
-                        t.tempo_final_execucao_atual is not None) else self.tempo_atual - t.tempo_chegada
-                    if tempo_aguardando > self.limite(tarefas_que_chegaram):
-                        tarefa_maior_que_limite = t
+                for indice, entrada in enumerate(prontas):
+                    tempo_aguardando = tempo_atual - entrada[2].tempo_ref
+                    if tempo_aguardando > lim:
+                        indice_escolhido = indice
                         break
-                if tarefa_maior_que_limite is not None:
-                    tarefa = tarefa_maior_que_limite
 
-                fila.remove(tarefa)
+                tarefa = remover_pronta(prontas, indice_escolhido)
 
                 if tarefa.tempo_restante > 0:
-                    tempo_aguardando = self.tempo_atual - tarefa.tempo_final_execucao_atual if (
-                        tarefa.tempo_final_execucao_atual is not None) else (tarefa.tempo_de_resposta if tarefa.tempo_de_resposta is not None else self.tempo_atual - tarefa.tempo_chegada)
-                    tarefa.tempo_inicio_execucao_atual = max(
-                        self.tempo_atual, tarefa.tempo_chegada)
+                    final_anterior = tarefa.tempo_final_execucao_atual
+                    tempo_aguardando = tempo_atual - final_anterior if (
+                        final_anterior is not None) else (tarefa.tempo_de_resposta if tarefa.tempo_de_resposta is not None else tempo_atual - tarefa.tempo_chegada)
+                    inicio = max(tempo_atual, tarefa.tempo_chegada)
+                    tarefa.tempo_inicio_execucao_atual = inicio
 
-                    tarefa.tempo_inicio = tarefa.tempo_inicio_execucao_atual if tarefa.tempo_inicio is None else tarefa.tempo_inicio
-                    tempo_exec = min(tarefa.tempo_restante, self.quantum)
+                    tarefa.tempo_inicio = inicio if tarefa.tempo_inicio is None else tarefa.tempo_inicio
+                    tempo_exec = min(tarefa.tempo_restante, quantum)
 
-                    tarefa.tempo_em_espera += tarefa.tempo_inicio_execucao_atual - \
-                        (tarefa.tempo_final_execucao_atual if tarefa.tempo_final_execucao_atual is not None else 0)
+                    tarefa.tempo_em_espera += inicio - (final_anterior if final_anterior is not None else 0)
 
-                    # print( f"[{self.tempo_atual}s] Executando tarefa {tarefa.nome} de {tarefa.duracao} segundos por {tempo_exec} segundos. (chegada: {tarefa.tempo_chegada}s, limite de espera: {self.limite(tarefas_que_chegaram)}s, tempo_espera: {(tempo_aguardando)}s)")
+                    # print( f"[{self.tempo_atual}s] Executando tarefa {tarefa.nome} de {tarefa.duracao} segundos por {tempo_exec} segundos. (chegada: {tarefa.tempo_chegada}s, limite de espera: {lim}s, tempo_espera: {(tempo_aguardando)}s)")
 
                     # time.sleep(tempo_exec / 10)  # Simula a execução da tarefa 10x mais rapida
 
-                    self.tempo_atual = tarefa.tempo_inicio_execucao_atual + tempo_exec
-                    tarefa.tempo_final_execucao_atual = self.tempo_atual
-                    tarefa.tempos_execucao.append(
-                        (tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual))
+                    fim = inicio + tempo_exec
+                    self.tempo_atual = fim
+                    tarefa.tempo_final_execucao_atual = fim
+                    tarefa.tempo_ref = fim
+                    tarefa.registrar_execucao(inicio, fim)
                     tarefa.tempo_restante -= tempo_exec
 
                     tarefa.tempo_de_resposta = tarefa.tempo_inicio - tarefa.tempo_chegada
@@ -907,15 +718,7 @@ class EscalonadorFutureVisionMin(EscalonadorCAV):
                         self.registrar_sobrecarga(0.3)
                         self.tempo_atual += 0.3
 
-                        if (fila):
-                            for i in range(len(fila)):
-                                if (fila[i].tempo_chegada > self.tempo_atual):
-                                    fila.insert(i, tarefa)
-                                    break
-                                if (i == len(fila) - 1):
-                                    fila.append(tarefa)
-                        else:
-                            fila.append(tarefa)
+                        self.reinserir_preemptada(chegadas, prontas, tarefa, ordem)
 
                         # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} ainda pendente.\n")
                     else:
@@ -925,120 +728,6 @@ class EscalonadorFutureVisionMin(EscalonadorCAV):
         self.exibir_sobrecarga()
 
 
-# class EscalonadorFutureVisionMax(EscalonadorCAV):
-#     def __init__(self, quantum):
-#         super().__init__()
-#         self.quantum = quantum
-
-#     def limite(self, tarefas_que_chegaram):
-#         if (len(tarefas_que_chegaram) > 0):
-#             duracao_total = 0
-#             chegada_total = 0
-#             min_chegada = tarefas_que_chegaram[0].tempo_chegada
-#             max_chegada = tarefas_que_chegaram[0].tempo_chegada
-#             mediana_chegada = 0
-
-#             if (len(tarefas_que_chegaram) % 2 == 0):
-#                 mediana_chegada = (tarefas_que_chegaram[len(
-#                     tarefas_que_chegaram) // 2 - 1].tempo_chegada + tarefas_que_chegaram[len(tarefas_que_chegaram) // 2].tempo_chegada) / 2
-#             else:
-#                 mediana_chegada = tarefas_que_chegaram[len(
-#                     tarefas_que_chegaram) // 2].tempo_chegada
-
-#             for tarefa in tarefas_que_chegaram:
-#                 duracao_total += tarefa.tempo_restante
-#                 chegada_total += tarefa.tempo_chegada
-#                 min_chegada = min(min_chegada, tarefa.tempo_chegada)
-#                 max_chegada = max(max_chegada, tarefa.tempo_chegada)
-
-#             duracao_media = duracao_total/len(tarefas_que_chegaram)
-#             chegada_media_intervalo = (min_chegada + max_chegada) // 2
-#             chegada_media = chegada_total/len(tarefas_que_chegaram)
-
-#             lim_espera = duracao_media + \
-#                 max(chegada_media, chegada_media_intervalo, mediana_chegada)
-#             return lim_espera
-#         return 0
-
-#     def escalonar(self):
-#         """Escalonamento Round Robin com tarefas de CAVs"""
-#         self.tarefas.sort(key=lambda tarefa: tarefa.tempo_chegada)
-#         fila = deque(self.tarefas)
-
-#         if (len(self.tarefas) > 0):
-#             self.tempo_atual = self.tarefas[0].tempo_chegada
-
-#             while fila:
-#                 tarefas_que_chegaram = [
-#                     tarefa for tarefa in fila if tarefa.tempo_chegada <= self.tempo_atual]
-#                 if (len(tarefas_que_chegaram) == 0):
-#                     self.tempo_atual = math.ceil(self.tempo_atual + 1)
-#                     continue
-
-#                 tarefas_que_chegaram.sort(
-#                     key=lambda tarefa: tarefa.tempo_restante)
-#                 tarefa = tarefas_que_chegaram[0]
-#                 tarefa_maior_que_limite = None
-
-#                 for t in tarefas_que_chegaram:
-#                     tempo_aguardando = self.tempo_atual - t.tempo_final_execucao_atual if (
-#                         t.tempo_final_execucao_atual is not None) else self.tempo_atual - t.tempo_chegada
-#                     if tempo_aguardando > self.limite(tarefas_que_chegaram):
-#                         tarefa_maior_que_limite = t
-#                         break
-#                 if tarefa_maior_que_limite is not None:
-#                     tarefa = tarefa_maior_que_limite
-
-#                 fila.remove(tarefa)
-
-#                 if tarefa.tempo_restante > 0:
-#                     tempo_aguardando = self.tempo_atual - tarefa.tempo_final_execucao_atual if (
-#                         tarefa.tempo_final_execucao_atual is not None) else (tarefa.tempo_de_resposta if tarefa.tempo_de_resposta is not None else self.tempo_atual - tarefa.tempo_chegada)
-#                     tarefa.tempo_inicio_execucao_atual = max(
-#                         self.tempo_atual, tarefa.tempo_chegada)
-
-#                     tarefa.tempo_inicio = tarefa.tempo_inicio_execucao_atual if tarefa.tempo_inicio is None else tarefa.tempo_inicio
-#                     tempo_exec = min(tarefa.tempo_restante, self.quantum)
-
-#                     tarefa.tempo_em_espera += tarefa.tempo_inicio_execucao_atual - \
-#                         (tarefa.tempo_final_execucao_atual if tarefa.tempo_final_execucao_atual is not None else 0)
-
-#                     # print( f"[{self.tempo_atual}s] Executando tarefa {tarefa.nome} de {tarefa.duracao} segundos por {tempo_exec} segundos. (chegada: {tarefa.tempo_chegada}s, limite de espera: {self.limite(tarefas_que_chegaram)}s, tempo_espera: {(tempo_aguardando)}s)")
-
-#                     # time.sleep(tempo_exec / 10)  # Simula a execução da tarefa 10x mais rapida
-
-#                     self.tempo_atual = tarefa.tempo_inicio_execucao_atual + tempo_exec
-#                     tarefa.tempo_final_execucao_atual = self.tempo_atual
-#                     tarefa.tempos_execucao.append(
-#                         (tarefa.tempo_inicio_execucao_atual, tarefa.tempo_final_execucao_atual))
-#                     tarefa.tempo_restante -= tempo_exec
-
-#                     tarefa.tempo_de_resposta = tarefa.tempo_inicio - tarefa.tempo_chegada
-
-#                     if tarefa.tempo_restante > 0:
-#                         # Registrando a sobrecarga, como exemplo, podemos adicionar um tempo fixo de sobrecarga
-#                         # 0.3 segundos de sobrecarga por tarefa
-#                         self.registrar_sobrecarga(0.3)
-#                         self.tempo_atual += 0.3
-
-#                         if (fila):
-#                             for i in range(len(fila)):
-#                                 if (fila[i].tempo_chegada > self.tempo_atual):
-#                                     fila.insert(i, tarefa)
-#                                     break
-#                                 if (i == len(fila) - 1):
-#                                     fila.append(tarefa)
-#                         else:
-#                             fila.append(tarefa)
-
-#                         # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} ainda pendente.\n")
-#                     else:
-#                         tarefa.tempo_final = self.tempo_atual
-#                         # print(f"[{self.tempo_atual}s] Tarefa {tarefa.nome} finalizada.\nBursts: {tarefa.tempos_execucao}\n")
-
-#         self.exibir_sobrecarga()
-
-
 class CAV:
     def __init__(self, id):
         self.id = id  # Identificador único para cada CAV
@@ -1047,13 +736,19 @@ class CAV:
     def adicionar_tarefa(self, tarefa):
         self.tarefas.append(tarefa)
 
+    def reset(self):
+        """Reinicia as tarefas do CAV para que ele seja reaproveitado por outro escalonador"""
+        for tarefa in self.tarefas:
+            tarefa.reset()
+
     def executar_tarefas(self, escalonador):
         # print(f"CAV {self.id} começando a execução de tarefas...\n")
         escalonador.escalonar()
         # print(f"CAV {self.id} terminou todas as suas tarefas.\n")
 
 # Função para criar algumas tarefas fictícias
-def criar_tarefas():
+def criar_tarefas(gerador=random):
+    """Sorteia as tarefas de uma rodada com o gerador informado (por padrão, o módulo random)"""
     # tarefas = [
     #     TarefaCAV("Detecção de Obstáculo", 10, prioridade=100, tempo_chegada=5, possivelmente_catastrofico=True, deadline=16),
     #     TarefaCAV("Planejamento de Rota", 5, prioridade=2, tempo_chegada=5, possivelmente_catastrofico=False, deadline=3),
@@ -1077,206 +772,155 @@ def criar_tarefas():
     #     # TarefaCAV("Envio de Diagnóstico Remoto", 4, prioridade=4, tempo_chegada=27, possivelmente_catastrofico=False),
     # ]
     # return tarefas
-    quantidade = random.randint(1, 500)
-    tarefas = []
-    
-    for i in range(quantidade):
-        # duracao = max(random.normalvariate(5, 10), 1)
-        duracao = random.random() * 59 + 1
-        # print(duracao)
-        tarefas.append(TarefaCAV(
+    quantidade = gerador.randint(1, 500)
+
+    # Cada coluna é sorteada de uma vez: random.choices sobre um range é bem mais barato que randint por tarefa
+    # duracoes = [max(random.normalvariate(5, 10), 1) for _ in range(quantidade)]
+    duracoes = [gerador.random() * 59 + 1 for _ in range(quantidade)]
+    prioridades = gerador.choices(range(1, 51), k=quantidade)
+    chegadas = gerador.choices(range(0, quantidade // 10 + 1), k=quantidade)
+    catastroficos = gerador.choices((True, False), k=quantidade)
+    deadlines = gerador.choices(range(0, 1001), k=quantidade)
+
+    tarefas = [
+        TarefaCAV(
             nome=f"Tarefa {i}", 
             duracao=duracao, 
-            prioridade=random.randint(1, 50),
-            tempo_chegada=random.randint(0, quantidade // 10),
-            possivelmente_catastrofico=random.choice([True, False]),
-            deadline=random.randint(0, 1000)
-        ))
+            prioridade=prioridade,
+            tempo_chegada=chegada,
+            possivelmente_catastrofico=catastrofico,
+            deadline=deadline
+        )
+        for i, (duracao, prioridade, chegada, catastrofico, deadline)
+        in enumerate(zip(duracoes, prioridades, chegadas, catastroficos, deadlines))
+    ]
         
     return tarefas
 
+def copiar_tarefas(tarefas):
+    """Cria cópias independentes das tarefas com clone(), bem mais barato que deepcopy"""
+    return [tarefa.clone() for tarefa in tarefas]
+
+# Escalonadores disponíveis para simulação: nome -> (classe, argumentos do construtor)
+ESCALONADORES = {
+    'FIFO': (EscalonadorFIFO, ()),
+    'SJF': (EscalonadorSJF, ()),
+    'RR': (EscalonadorRoundRobin, (3,)),
+    'EDF': (EscalonadorEDF, (2,)),
+    'PrioNP': (EscalonadorPrioridadeNP, ()),
+    'PrioP': (EscalonadorPrioridadeP, (2,)),
+    'UG': (EscalonadorUG, (3,)),
+    'VF': (EscalonadorFutureVision, (3, 'mediana')),
+    'VFmed': (EscalonadorFutureVision, (3, 'media')),
+    'VFmedintervalo': (EscalonadorFutureVision, (3, 'intervalo')),
+    'VFmin': (EscalonadorFutureVision, (3, 'min')),
+    'VFmax': (EscalonadorFutureVision, (3, 'max')),
+}
+
+def simular(nome, simulador, verbose=False):
+    """
+    Executa, no CAV simulador, o escalonador registrado em ESCALONADORES com esse nome sobre as tarefas do CAV
+    e o retorna; com verbose=True, as métricas da simulação são exibidas.
+    """
+    classe, argumentos = ESCALONADORES[nome]
+    escalonador = classe(*argumentos)
+    for t in simulador.tarefas:
+        escalonador.adicionar_tarefa(t)
+
+    simulador.executar_tarefas(escalonador)
+    escalonador.calcular_e_exibir_metricas(verbose)
+    return escalonador
+
+# Escalonadores comparados em cada rodada da simulação; os resultados de cada rodada são listas na mesma ordem
+COMPARADOS = ('SJF', 'RR', 'VFmedintervalo', 'VFmin')
+
 # Exemplo de uso
-def main():
+def main(rodada, semente, verbose=False):
+    """
+    Executa uma rodada da simulação e retorna (quantidade de tarefas, turnarounds médios na ordem de COMPARADOS).
+    As tarefas são sorteadas por um gerador próprio da rodada, derivado da semente da execução.
+    Com verbose=True, exibe também as métricas de cada escalonador.
+    """
+    # Gerador próprio por rodada: resultados reproduzíveis mesmo rodando em paralelo, sem mexer no random global
+    gerador = random.Random(f"{semente}-{rodada}")
+
     # Criar algumas tarefas fictícias
-    tarefas_originais = criar_tarefas()
+    tarefas_originais = criar_tarefas(gerador)
 
-    tarefas = deepcopy(tarefas_originais)
+    tarefas = copiar_tarefas(tarefas_originais)
 
-    avgs_turnarounds = []
+    turnarounds = []
 
     # Criar um CAV
     cav = CAV(id=1)
     for t in tarefas:
         cav.adicionar_tarefa(t)
 
+    # Escalonadores comparados nesta simulação, todos no mesmo CAV e sobre as mesmas tarefas, reiniciadas antes de cada um
+    for nome in COMPARADOS:
+        cav.reset()
+        # print(f"Simulando CAV com {nome}:\n")
+        escalonador = simular(nome, cav, verbose)
+        turnarounds.append(escalonador.calcular_turnaround_medio())
 
-    # # print("Simulando CAV com Prioridade P:\n")
-    # escalonador_p = EscalonadorPrioridadeP(2)
-    # for t in tarefas:
-    #     escalonador_p.adicionar_tarefa(t)
-
-    # simulador_p = CAV(id=1)
-    # simulador_p.executar_tarefas(escalonador_p)
-    # escalonador_p.calcular_e_exibir_metricas(tarefas)
-
-    # tarefas = criar_tarefas()
-
-    # # print("Simulando CAV com EDF:\n")
-    # escalonador_EDF = EscalonadorEDF(2)
-    # for t in tarefas:
-    #     escalonador_EDF.adicionar_tarefa(t)
-
-    # simulador_EDF = CAV(id=1)
-    # simulador_EDF.executar_tarefas(escalonador_EDF)
-    # escalonador_EDF.calcular_e_exibir_metricas(tarefas)
-
-    tarefas = deepcopy(tarefas_originais)
-    # print(list(t.tempos_execucao for t in tarefas))
-
-    # print("Simulando CAV com SJF:\n")
-    escalonador_SJF = EscalonadorSJF()
-    for t in tarefas:
-        escalonador_SJF.adicionar_tarefa(t)
-
-    simulador_SJF = CAV(id=1)
-    simulador_SJF.executar_tarefas(escalonador_SJF)
-    escalonador_SJF.calcular_e_exibir_metricas()
-    avgs_turnarounds.append(('SJF', escalonador_SJF.calcular_turnaround_medio()))
-
-    # tarefas = criar_tarefas()
-
-    # # Criar um escalonador FIFO
-    # # print("Simulando CAV com FIFO:\n")
-    # escalonador_fifo = EscalonadorFIFO()
-    # for t in tarefas:
-    #     escalonador_fifo.adicionar_tarefa(t)
-        
-    # simulador_fifo = CAV(id=1)
-    # simulador_fifo.executar_tarefas(escalonador_fifo)
-    # escalonador_fifo.calcular_e_exibir_metricas()
-
-    tarefas = deepcopy(tarefas_originais)
-    # print(list(t.tempos_execucao for t in tarefas))
-
-    # Criar um escalonador Round Robin com quantum de 3 segundos
-    # print("\nSimulando CAV com Round Robin:\n")
-    escalonador_rr = EscalonadorRoundRobin(quantum=3)
-    for t in tarefas:
-        escalonador_rr.adicionar_tarefa(t)
-
-    simulador_rr = CAV(id=1)
-    simulador_rr.executar_tarefas(escalonador_rr)
-    escalonador_rr.calcular_e_exibir_metricas()
-    avgs_turnarounds.append(
-        ('RR', escalonador_rr.calcular_turnaround_medio()))
-
-    # tarefas = criar_tarefas()
-
-    # # Criar um escalonador por Prioridade
-    # # print("\nSimulando CAV com Escalonamento por Prioridade:\n")
-    # escalonador_prio = EscalonadorPrioridadeNP()
-    # for t in tarefas:
-    #     escalonador_prio.adicionar_tarefa(t)
+    return len(tarefas), turnarounds
 
-    # simulador_prio = CAV(id=1)
-    # simulador_prio.executar_tarefas(escalonador_prio)
-    # escalonador_prio.calcular_e_exibir_metricas()
-
-    # tarefas = criar_tarefas()
-
-    # # Criar um escalonador por Último gás
-    # # print("\nSimulando CAV com Escalonamento por Último Gás:\n")
-    # escalonador_ug = EscalonadorUG(3)
-    # for t in tarefas:
-    #     escalonador_ug.adicionar_tarefa(t)
-
-    # simulador_ug = CAV(id=1)
-    # simulador_ug.executar_tarefas(escalonador_ug)
-    # escalonador_ug.calcular_e_exibir_metricas()
-    
-    tarefas = deepcopy(tarefas_originais)
-    # print(list(t.tempos_execucao for t in tarefas))
-    
-    # print("\nSimulando CAV com Escalonamento por visão do futuro (mediana):\n")
-    """escalonador_vf = EscalonadorFutureVision(3)
-    for t in tarefas:
-        escalonador_vf.adicionar_tarefa(t)
-
-    simulador_vf = CAV(id=1)
-    simulador_vf.executar_tarefas(escalonador_vf)
-    escalonador_vf.calcular_e_exibir_metricas()
-    avgs_turnarounds.append(
-        ('VF', escalonador_vf.calcular_turnaround_medio()))
-    
-    tarefas = deepcopy(tarefas_originais)
-    # print(list(t.tempos_execucao for t in tarefas))
-
-    # print("\nSimulando CAV com Escalonamento por visão do futuro (media):\n")
-    escalonador_vfmed = EscalonadorFutureVisionMedia(3)
-    for t in tarefas:
-        escalonador_vfmed.adicionar_tarefa(t)
-
-    simulador_vfmed = CAV(id=1)
-    simulador_vfmed.executar_tarefas(escalonador_vfmed)
-    escalonador_vfmed.calcular_e_exibir_metricas()
-    avgs_turnarounds.append(
-        ('VFmed', escalonador_vfmed.calcular_turnaround_medio()))
-     """
-    
-    tarefas = deepcopy(tarefas_originais)
-    # print(list(t.tempos_execucao for t in tarefas))
-
-    # print("\nSimulando CAV com Escalonamento por visão do futuro (media do intervalo):\n")
-    escalonador_vfmedintervalo = EscalonadorFutureVisionMediaIntervalo(3)
-    for t in tarefas:
-        escalonador_vfmedintervalo.adicionar_tarefa(t)
-
-    simulador_vfmedintervalo = CAV(id=1)
-    simulador_vfmedintervalo.executar_tarefas(escalonador_vfmedintervalo)
-    escalonador_vfmedintervalo.calcular_e_exibir_metricas()
-    avgs_turnarounds.append(
-        ('VFmedintervalo', escalonador_vfmedintervalo.calcular_turnaround_medio()))
-    
-    
-    tarefas = deepcopy(tarefas_originais)
-    # print(list(t.tempos_execucao for t in tarefas))
-
-    # print("\nSimulando CAV com Escalonamento por visão do futuro (media do intervalo):\n")
-    escalonador_vfmin = EscalonadorFutureVisionMin(3)
-    for t in tarefas:
-        escalonador_vfmin.adicionar_tarefa(t)
-
-    simulador_vfmin = CAV(id=1)
-    simulador_vfmin.executar_tarefas(escalonador_vfmin)
-    escalonador_vfmin.calcular_e_exibir_metricas()
-    avgs_turnarounds.append(
-        ('VFmin', escalonador_vfmin.calcular_turnaround_medio()))
-    
-    """ tarefas = deepcopy(tarefas_originais)
-    # print(list(t.tempos_execucao for t in tarefas))
-
-    # print("\nSimulando CAV com Escalonamento por visão do futuro (media do intervalo):\n")
-    escalonador_vfmax = EscalonadorFutureVisionMax(3)
-    for t in tarefas:
-        escalonador_vfmax.adicionar_tarefa(t)
-
-    simulador_vfmax = CAV(id=1)
-    simulador_vfmax.executar_tarefas(escalonador_vfmax)
-    escalonador_vfmax.calcular_e_exibir_metricas()
-    avgs_turnarounds.append(
-        ('VFmax', escalonador_vfmax.calcular_turnaround_medio()))
+class EstatisticaIncremental:
+    """Média e desvio padrão acumulados valor a valor (algoritmo de Welford), sem guardar os valores"""
+    def __init__(self):
+        self.n = 0
+        self.media = 0
+        self.m2 = 0  # Soma dos quadrados das diferenças para a média
+
+    def adicionar(self, valor):
+        self.n += 1
+        delta = valor - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (valor - self.media)
+
+    @property
+    def desvio_padrao(self):
+        """Desvio padrão populacional dos valores adicionados"""
+        return (self.m2 / self.n) ** 0.5 if self.n > 0 else 0
+
+def executar_rodadas(rodadas, semente, verbose=False):
     """
+    Gera o resultado de main para cada rodada, na ordem das rodadas. Sem verbose, as rodadas rodam em paralelo
+    em processos; com verbose, rodam em sequência no processo atual para que os relatórios não se misturem na saída.
+    """
+    if verbose:
+        for rodada in range(rodadas):
+            yield main(rodada, semente, verbose=True)
+    else:
+        with ProcessPoolExecutor() as executor:
+            yield from executor.map(main, range(rodadas), itertools.repeat(semente))
+
+def exibir_rodada(quantidade, turnarounds):
+    print(quantidade)
+    print(list(zip(COMPARADOS, turnarounds)))
     
-    print(len(tarefas))
-    print(avgs_turnarounds)
-    
-    menor_avg = avgs_turnarounds[1]
-    for avg in avgs_turnarounds[2:]:
-        if avg[1] < menor_avg[1]:
-            menor_avg = avg
+    # Menor turnaround a partir do segundo escalonador (em caso de empate, o primeiro)
+    menor = min(range(1, len(turnarounds)), key=turnarounds.__getitem__)
             
-    print('menor dos FV:', menor_avg)
+    print('menor dos FV:', (COMPARADOS[menor], turnarounds[menor]))
     
 if __name__ == "__main__":
-    for i in range(100):
-        main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Compara escalonadores de tarefas de CAVs ao longo de várias rodadas")
+    parser.add_argument('--verbose', action='store_true', help="exibe também as métricas de cada escalonador e os resultados de cada rodada")
+    parser.add_argument('--semente', type=int, default=None, help="semente da execução, para repetir os mesmos sorteios (padrão: aleatória)")
+    args = parser.parse_args()
+
+    semente = args.semente if args.semente is not None else random.randrange(2**32)
+    print(f"Semente: {semente}")
+
+    # As rodadas são independentes: cada uma executa todos os escalonadores sobre as mesmas tarefas
+    rodadas = 100
+    estatisticas = [EstatisticaIncremental() for _ in COMPARADOS]  # Turnaround médio de cada escalonador ao longo das rodadas
+    for quantidade, turnarounds in executar_rodadas(rodadas, semente, args.verbose):
+        for estatistica, turnaround in zip(estatisticas, turnarounds):
+            estatistica.adicionar(turnaround)
+        if args.verbose:
+            exibir_rodada(quantidade, turnarounds)
+
+    for nome, estatistica in zip(COMPARADOS, estatisticas):
+        print(f"{nome}: turnaround médio {estatistica.media:.2f} (desvio padrão {estatistica.desvio_padrao:.2f}) em {estatistica.n} rodadas")
\ No newline at end of file